@@ -2,67 +2,546 @@
 
 This module provides a CLI to convert HY3 files to JSON with optional
 post-processing to a flatter, more consumable structure.
+
+Optional dependencies are grouped into package extras:
+
+- `fast`: `orjson` encodes the output, with `ujson` for indents orjson does
+  not support. Without them the standard library `json` module is used.
+- `msgpack`: needed for `--format msgpack`.
+- `zstd`: needed for `--compress zst`.
+
+e.g. `pip install hytek-parser[fast,zstd]`.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import glob
+import gzip
 import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional
+from itertools import repeat
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+)
 
 from aenum import Enum as AEnum
-from attrs import asdict
-
+from attrs import asdict, fields
+
+from hytek_parser.hy3.schemas import (
+    DisqualificationInfo,
+    Event,
+    EventEntry,
+    Meet,
+    ParsedHytekFile,
+    Software,
+    Swimmer,
+    Team,
+)
 from hytek_parser.hy3_parser import parse_hy3
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None  # type: ignore[assignment]
+else:
+    # Older ujson lacks `default=` and may format floats unlike the stdlib
+    _UJSON_VERSION = tuple(
+        int(part) if part.isdecimal() else 0
+        for part in ujson.__version__.split(".")[:2]
+    )
+    if _UJSON_VERSION < (5, 4):  # pragma: no cover - depends on environment
+        ujson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
 
 # -----------------------------
 # Serialization helpers
 # -----------------------------
 
-def _value_serializer(inst: Any, field: Any, value: Any) -> Any:
-    """attrs.asdict value serializer to make objects JSON-friendly.
+def _isoformat(value: Any) -> Any:
+    """Serialize a date or datetime as an ISO 8601 string."""
+    return value.isoformat()
+
+
+def _enum_name(value: Any) -> Any:
+    """Serialize an enum member as its name."""
+    return value.name
+
+
+# Converter for each concrete value type, None meaning "leave unchanged".
+# Types are added the first time they are seen, so lookups are one dict hit.
+_JSON_CONVERTERS: Dict[type, Optional[Callable[[Any], Any]]] = {
+    date: _isoformat,
+    datetime: _isoformat,
+    str: None,
+    int: None,
+    float: None,
+    bool: None,
+    type(None): None,
+}
+
+
+def _json_value(value: Any) -> Any:
+    """Make a single value JSON-friendly.
 
     - datetime/date -> ISO 8601 strings
     - aenum.Enum -> the enum name (e.g., "SCY", "MALE")
     - everything else -> unchanged
     """
+    value_type = type(value)
+    try:
+        convert = _JSON_CONVERTERS[value_type]
+    except KeyError:
+        if isinstance(value, (date, datetime)):
+            convert = _isoformat
+        elif isinstance(value, AEnum):
+            convert = _enum_name
+        else:
+            convert = None
+        _JSON_CONVERTERS[value_type] = convert
+
+    return value if convert is None else convert(value)
 
-    if isinstance(value, (date, datetime)):
-        return value.isoformat()
-    if isinstance(value, AEnum):
-        return value.name
-    return value
+
+# Entries reference swimmers already listed under the meet
+_ENTRY_SWIMMERS = fields(EventEntry).swimmers
+
+
+def _value_serializer(inst: Any, field: Any, value: Any) -> Any:
+    """attrs.asdict value serializer, see `_json_value`.
+
+    Entry swimmers are serialized as their meet ids rather than as full
+    copies of each swimmer.
+    """
+    if field is _ENTRY_SWIMMERS:
+        return [s.meet_id for s in value]
+    return _json_value(value)
+
+
+def _default(obj: Any) -> Any:
+    """JSON encoder fallback for values not already made JSON-friendly."""
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, AEnum):
+        return obj.name
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: int) -> bytes:
+    """Encode `data` as UTF-8 JSON with the fastest encoder that can honor `indent`.
+
+    orjson only supports two-space indentation. ujson matches the standard
+    library layout for any positive indent, but treats 0 as no indent at all,
+    so only the standard library encoder handles every indent. The layout is
+    the same whichever encoder is used, but floats in exponent form are not
+    spelled alike, e.g. 1e-7 and 1e22 rather than 1e-07 and 1e+22.
+    """
+    if orjson is not None and indent == 2:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=_default, option=option)
+
+    if ujson is not None and indent > 0:
+        return ujson.dumps(
+            data,
+            indent=indent,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            default=_default,
+        ).encode("utf-8")
+
+    text = json.dumps(data, indent=indent, ensure_ascii=False, default=_default)
+    return text.encode("utf-8")
 
 
 def _drop_none(d: MutableMapping[str, Any]) -> Dict[str, Any]:
     """Return a copy without keys whose value is None or empty dict."""
-    result: Dict[str, Any] = {}
-    for k, v in d.items():
-        if v is None:
-            continue
-        if isinstance(v, dict) and not v:
-            # drop empty mapping
-            continue
-        result[k] = v
-    return result
+    return {
+        k: v for k, v in d.items() if v is not None and (not isinstance(v, dict) or v)
+    }
 
 
 def _sorted_events(events: Mapping[str, Any]) -> List[tuple[str, Any]]:
-    def _event_key(kv: tuple[str, Any]) -> tuple[int, str]:
-        key, _ = kv
-        try:
-            return (int(key), key)
-        except (TypeError, ValueError):
-            return (10**9, key)
+    """Sort events by number, with non-numeric numbers (e.g. "22X") last."""
+    # Keys are unique, so ties never fall through to comparing the events
+    decorated = [
+        (int(key) if key.isdecimal() else 10**9, key, event)
+        for key, event in events.items()
+    ]
+    decorated.sort()
+    return [(key, event) for _, key, event in decorated]
+
+
+# Nested selection of output keys parsed from --fields. A None value (or a
+# None selection) keeps everything below that key.
+_Selection = Optional[Dict[str, Any]]
+
 
-    return sorted(events.items(), key=_event_key)
+def _parse_fields(spec: str) -> Dict[str, Any]:
+    """Parse comma-separated dotted paths into a nested selection.
+
+    Paths that do not start with "file" or "meet" are relative to "meet",
+    e.g. "events.number" selects "meet.events.number". Raises
+    `argparse.ArgumentTypeError` for unknown paths or an empty selection.
+    """
+    selection: Dict[str, Any] = {}
+    for path in spec.split(","):
+        parts = [part for part in path.strip().split(".") if part]
+        if not parts:
+            continue
+        if parts[0] not in _OUTPUT_KEYS:
+            parts.insert(0, "meet")
+        _check_field_path(path.strip(), parts)
+
+        node = selection
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                # A shorter path already selects all of this branch
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+
+    if not selection:
+        raise argparse.ArgumentTypeError("no fields given")
+    return selection
+
+
+def _check_field_path(path: str, parts: List[str]) -> None:
+    """Check that `parts` names an output key at every level."""
+    keys: Optional[Dict[str, Any]] = _OUTPUT_KEYS
+    for depth, part in enumerate(parts):
+        if keys is None:
+            parent = parts[depth - 1]
+            raise argparse.ArgumentTypeError(f"{path!r}: {parent!r} has no fields")
+        if part not in keys:
+            choices = ", ".join(keys)
+            raise argparse.ArgumentTypeError(
+                f"{path!r}: unknown field {part!r}, expected one of {choices}"
+            )
+        keys = keys[part]
+
+
+def _wants(selection: _Selection, *path: str) -> bool:
+    """Check whether anything under `path` is selected."""
+    for key in path:
+        if selection is None:
+            return True
+        if key not in selection:
+            return False
+        selection = selection[key]
+    return True
+
+
+def _subfields(selection: _Selection, *path: str) -> _Selection:
+    """Get the selection under `path`, which must be wanted."""
+    for key in path:
+        if selection is None:
+            return None
+        selection = selection[key]
+    return selection
+
+
+def _select(value: Any, selection: _Selection) -> Any:
+    """Trim a reshaped value down to the selected keys."""
+    if selection is None:
+        return value
+    if isinstance(value, list):
+        return [_select(item, selection) for item in value]
+    if isinstance(value, dict):
+        return {k: _select(v, selection[k]) for k, v in value.items() if k in selection}
+    return value
 
 
-def _post_process(parsed: Dict[str, Any]) -> Dict[str, Any]:
-    """Reshape the raw attrs->dict output into a flatter JSON structure.
+def _dump_attrs(inst: Any, exclude: tuple[str, ...] = ()) -> Dict[str, Any]:
+    """Dump a flat attrs instance, serializing each value like `asdict`."""
+    return {
+        a.name: _json_value(getattr(inst, a.name))
+        for a in fields(type(inst))
+        if a.name not in exclude
+    }
+
+
+def _dump_dq(dq_info: DisqualificationInfo) -> Dict[str, Any]:
+    """Dump a leg's disqualification info."""
+    dq = {"code": _json_value(dq_info.code)}
+    if dq_info.info_str is not None:
+        dq["info"] = dq_info.info_str
+    return dq
+
+
+# (output key, EventEntry attribute, converter) for the seed and each result
+# leg, in output order. Built names are not interned like literals, so intern
+# them to match the attribute names on the class and keep getattr on its
+# identity fast path.
+_FieldSpec = tuple[str, str, Callable[[Any], Any]]
+
+_SEED_FIELDS: tuple[_FieldSpec, ...] = (
+    ("time", "seed_time", _json_value),
+    ("course", "seed_course", _json_value),
+    ("converted_time", "converted_seed_time", _json_value),
+    ("converted_course", "converted_seed_time_course", _json_value),
+)
+
+_LEG_FIELDS: Dict[str, tuple[_FieldSpec, ...]] = {
+    prefix: tuple(
+        (key, sys.intern(f"{prefix}_{name}"), convert)
+        for key, name, convert in (
+            ("time", "time", _json_value),
+            ("course", "course", _json_value),
+            ("time_code", "time_code", _json_value),
+            ("dq", "dq_info", _dump_dq),
+            ("heat", "heat", _json_value),
+            ("lane", "lane", _json_value),
+            ("heat_place", "heat_place", _json_value),
+            ("overall_place", "overall_place", _json_value),
+            ("date", "date", _json_value),
+            ("splits", "splits", _json_value),
+        )
+    )
+    for prefix in ("prelim", "swimoff", "finals")
+}
+
+# Attributes that are set whenever a leg was swum: time, time code, DQ info
+_LEG_SWUM_ATTRS: Dict[str, tuple[str, str, str]] = {
+    prefix: (
+        sys.intern(f"{prefix}_time"),
+        sys.intern(f"{prefix}_time_code"),
+        sys.intern(f"{prefix}_dq_info"),
+    )
+    for prefix in _LEG_FIELDS
+}
+
+
+def _dump_leg(entry: EventEntry, prefix: str) -> Optional[Dict[str, Any]]:
+    """Dump one of the prelim/swimoff/finals results of an entry."""
+    time_attr, time_code_attr, dq_attr = _LEG_SWUM_ATTRS[prefix]
+    if (
+        getattr(entry, dq_attr) is None
+        and getattr(entry, time_attr) is None
+        and getattr(entry, time_code_attr) is None
+    ):
+        # Leg was never swum, which is the usual case for swimoffs
+        return None
+
+    # Same filtering as _drop_none: only splits can be an empty mapping
+    leg = {
+        key: convert(value)
+        for key, name, convert in _LEG_FIELDS[prefix]
+        if (value := getattr(entry, name)) is not None
+        and (value or not isinstance(value, dict))
+    }
+    return leg or None
+
+
+def _dump_entry(entry: EventEntry) -> Dict[str, Any]:
+    """Dump an event entry, referencing swimmers by meet id."""
+    swimmer_ids = [s.meet_id for s in entry.swimmers]
+
+    seed = {
+        key: convert(value)
+        for key, name, convert in _SEED_FIELDS
+        if (value := getattr(entry, name)) is not None
+    }
+
+    return _drop_none(
+        {
+            "swimmers": swimmer_ids,
+            "relay": entry.relay,
+            "seed": seed or None,
+            "prelim": _dump_leg(entry, "prelim"),
+            "swimoff": _dump_leg(entry, "swimoff"),
+            "finals": _dump_leg(entry, "finals"),
+            "event_number": entry.event_number,
+        }
+    )
+
+
+def _dump_event(
+    number: str, event: Event, include_entries: bool = True
+) -> Dict[str, Any]:
+    """Dump an event and, unless excluded, all of its entries."""
+    entries = event.entries if include_entries else []
+    return _drop_none(
+        {
+            "number": number,
+            "distance": event.distance,
+            "stroke": _json_value(event.stroke),
+            "course": _json_value(event.course),
+            "date": _json_value(event.date_),
+            "fee": event.fee,
+            "gender": _json_value(event.gender),
+            "gender_age": _json_value(event.gender_age),
+            "age_min": event.age_min,
+            "age_max": event.age_max,
+            "open": event.open_,
+            "relay": event.relay,
+            "relay_team_id": event.relay_team_id,
+            "relay_swim_team_code": event.relay_swim_team_code,
+            "entries": [_dump_entry(entry) for entry in entries],
+        }
+    )
+
+
+# Output keys at each level of the reshaped document, used to check --fields.
+# A None value marks a key without fields of its own.
+_LEG_KEYS: Dict[str, Any] = {
+    key: {"code": None, "info": None} if key == "dq" else None
+    for key, _, _ in _LEG_FIELDS["finals"]
+}
+
+_OUTPUT_KEYS: Dict[str, Any] = {
+    "file": {
+        "description": None,
+        "software": dict.fromkeys(a.name for a in fields(Software)),
+        "date_created": None,
+        "licensee": None,
+    },
+    "meet": {
+        **dict.fromkeys(
+            [
+                "name",
+                "facility",
+                "start_date",
+                "end_date",
+                "altitude",
+                "country",
+                "masters",
+                "type",
+                "course",
+            ]
+        ),
+        "teams": {
+            **dict.fromkeys(a.name for a in fields(Team) if a.name != "swimmers"),
+            "code": None,
+        },
+        "swimmers": {**dict.fromkeys(a.name for a in fields(Swimmer)), "meet_id": None},
+        "events": {
+            **dict.fromkeys(
+                [
+                    "number",
+                    "distance",
+                    "stroke",
+                    "course",
+                    "date",
+                    "fee",
+                    "gender",
+                    "gender_age",
+                    "age_min",
+                    "age_max",
+                    "open",
+                    "relay",
+                    "relay_team_id",
+                    "relay_swim_team_code",
+                ]
+            ),
+            "entries": {
+                "swimmers": None,
+                "relay": None,
+                "seed": dict.fromkeys(key for key, _, _ in _SEED_FIELDS),
+                "prelim": _LEG_KEYS,
+                "swimoff": _LEG_KEYS,
+                "finals": _LEG_KEYS,
+                "event_number": None,
+            },
+        },
+    },
+}
+
+
+def _reshape_head(
+    parsed: ParsedHytekFile, selection: _Selection = None
+) -> Dict[str, Any]:
+    """Reshape everything but the events, which are left as an empty list."""
+    file_section = {
+        "description": parsed.file_description,
+        "software": _dump_attrs(parsed.software),
+        "date_created": _json_value(parsed.date_created),
+        "licensee": parsed.licensee,
+    }
+
+    meet: Meet = parsed.meet
+
+    # Teams -> list with explicit code, drop nested swimmers reference
+    teams_list: List[Dict[str, Any]] = []
+    teams = meet.teams if _wants(selection, "meet", "teams") else {}
+    for code, team in teams.items():
+        team_map = _dump_attrs(team, exclude=("swimmers",))
+        team_map["code"] = code
+        teams_list.append(team_map)
+
+    # Swimmers -> list with explicit meet_id
+    swimmers_list: List[Dict[str, Any]] = []
+    swimmers = meet.swimmers if _wants(selection, "meet", "swimmers") else {}
+    for meet_id, swimmer in swimmers.items():
+        swimmer_map = _dump_attrs(swimmer)
+        swimmer_map["meet_id"] = meet_id
+        swimmers_list.append(swimmer_map)
+
+    # Events are always the last key so they can be streamed after the rest
+    meet_out = _drop_none(
+        {
+            "name": meet.name,
+            "facility": meet.facility,
+            "start_date": _json_value(meet.start_date),
+            "end_date": _json_value(meet.end_date),
+            "altitude": meet.altitude,
+            "country": meet.country,
+            "masters": meet.masters,
+            "type": _json_value(meet.type_),
+            "course": _json_value(meet.course),
+            "teams": teams_list,
+            "swimmers": swimmers_list,
+            "events": [],
+        }
+    )
+
+    return _select({"file": _drop_none(file_section), "meet": meet_out}, selection)
+
+
+def _iter_events(
+    meet: Meet, selection: _Selection = None, include_entries: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """Yield reshaped events sorted by event number."""
+    include_entries = include_entries and _wants(selection, "entries")
+    for number, event in _sorted_events(meet.events):
+        yield _select(_dump_event(number, event, include_entries), selection)
+
+
+def _post_process(
+    parsed: ParsedHytekFile, selection: _Selection = None, include_entries: bool = True
+) -> Dict[str, Any]:
+    """Reshape a parsed file into a flatter JSON structure.
+
+    The attrs instances are walked directly, so no intermediate
+    `attrs.asdict` tree is built.
 
     Output layout:
     {
@@ -81,153 +560,251 @@ def _post_process(parsed: Dict[str, Any]) -> Dict[str, Any]:
          } ]
       }
     }
-    """
 
-    file_section = {
-        "description": parsed.get("file_description"),
-        "software": parsed.get("software"),
-        "date_created": parsed.get("date_created"),
-        "licensee": parsed.get("licensee"),
-    }
+    If `selection` is given, only the selected keys are kept and unselected
+    teams, swimmers, events and entries are never reshaped. Without
+    `include_entries` every event's entries are left empty.
+    """
+    data = _reshape_head(parsed, selection)
+    if _wants(selection, "meet", "events"):
+        event_selection = _subfields(selection, "meet", "events")
+        events = _iter_events(parsed.meet, event_selection, include_entries)
+        data["meet"]["events"] = list(events)
+    return data
+
+
+def _emit(
+    parsed: ParsedHytekFile,
+    f: BinaryIO,
+    indent: int,
+    selection: _Selection = None,
+    include_entries: bool = True,
+) -> None:
+    """Write the `_post_process` structure to `f` one event at a time.
+
+    Only a single reshaped event is held in memory at once. The output is
+    identical to encoding `_post_process` of the same arguments in one go.
+    """
+    head = _dumps(_reshape_head(parsed, selection), indent)
+    if not _wants(selection, "meet", "events"):
+        f.write(head)
+        return
+
+    # The empty events list is the last value in the document
+    split = head.rindex(b"[]") + 1
+    f.write(head[:split])
+
+    # Events sit three levels deep: document -> meet -> events list
+    newline = b"\n" + b" " * (3 * indent)
+    separator = newline
+    event_selection = _subfields(selection, "meet", "events")
+    for event in _iter_events(parsed.meet, event_selection, include_entries):
+        f.write(separator)
+        f.write(_dumps(event, indent).replace(b"\n", newline))
+        separator = b"," + newline
+
+    if separator is not newline:
+        # At least one event was written, close the list on its own line
+        f.write(b"\n" + b" " * (2 * indent))
+    f.write(head[split:])
+
+
+def _emit_msgpack(
+    parsed: ParsedHytekFile,
+    f: BinaryIO,
+    selection: _Selection = None,
+    include_entries: bool = True,
+) -> None:
+    """Write the `_post_process` structure to `f` as MessagePack.
+
+    Like `_emit`, events are packed one at a time after the rest of the
+    document. Split numbers are kept as integer map keys, so unpack with
+    `strict_map_key=False`.
+    """
+    packer = msgpack.Packer(use_bin_type=True, default=_default)
+    head = _reshape_head(parsed, selection)
+    if not _wants(selection, "meet", "events"):
+        f.write(packer.pack(head))
+        return
+
+    # "meet" is the last key of the document and "events" the last of "meet"
+    meet = head.pop("meet")
+    meet.pop("events")
+    f.write(packer.pack_map_header(len(head) + 1))
+    for key, value in head.items():
+        f.write(packer.pack(key))
+        f.write(packer.pack(value))
+
+    f.write(packer.pack("meet"))
+    f.write(packer.pack_map_header(len(meet) + 1))
+    for key, value in meet.items():
+        f.write(packer.pack(key))
+        f.write(packer.pack(value))
+
+    f.write(packer.pack("events"))
+    f.write(packer.pack_array_header(len(parsed.meet.events)))
+    event_selection = _subfields(selection, "meet", "events")
+    for event in _iter_events(parsed.meet, event_selection, include_entries):
+        f.write(packer.pack(event))
+
+
+# Output file suffix for each --format and --compress choice
+_FORMAT_SUFFIXES = {"json": ".json", "msgpack": ".msgpack"}
+_COMPRESSION_SUFFIXES = {"none": "", "gz": ".gz", "zst": ".zst"}
+
+
+# Streaming writes one small chunk per event, so use a larger file buffer
+# than the default to cut down on write syscalls.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@contextlib.contextmanager
+def _open_output(path: str, compress: str) -> Iterator[BinaryIO]:
+    """Open `path` for buffered binary writing, compressing if requested."""
+    with contextlib.ExitStack() as stack:
+        f: BinaryIO = stack.enter_context(
+            open(path, "wb", buffering=_WRITE_BUFFER_SIZE)
+        )
+        if compress == "gz":
+            f = stack.enter_context(  # type: ignore[assignment]
+                gzip.GzipFile(fileobj=f, mode="wb", compresslevel=6)
+            )
+        elif compress == "zst":
+            cctx = zstandard.ZstdCompressor()
+            f = stack.enter_context(cctx.stream_writer(f, closefd=False))
 
-    meet: Dict[str, Any] = dict(parsed.get("meet", {}))
+        yield f
 
-    # Teams -> list with explicit code, drop nested swimmers reference
-    teams: Mapping[str, Any] = meet.get("teams", {}) or {}
-    teams_list: List[Dict[str, Any]] = []
-    for code, team in teams.items():
-        team_map: Dict[str, Any] = dict(team)
-        team_map["code"] = code
-        team_map.pop("swimmers", None)  # global swimmers list covers this
-        teams_list.append(team_map)
 
-    # Swimmers -> list with explicit meet_id
-    swimmers: Mapping[str, Any] = meet.get("swimmers", {}) or {}
-    swimmers_list: List[Dict[str, Any]] = []
-    for meet_id, swimmer in swimmers.items():
-        swimmer_map: Dict[str, Any] = dict(swimmer)
-        swimmer_map["meet_id"] = int(meet_id) if isinstance(meet_id, str) and meet_id.isdigit() else meet_id
-        swimmers_list.append(swimmer_map)
+def _is_glob(path: str) -> bool:
+    """Check whether `path` is a glob pattern rather than a literal path.
 
-    # Events -> list sorted by event number
-    events: Mapping[str, Any] = meet.get("events", {}) or {}
-    events_list: List[Dict[str, Any]] = []
-    for event_number, event in _sorted_events(events):
-        e_map: Dict[str, Any] = dict(event)
-        e_map["number"] = event_number
-
-        # Entries -> reshape timing info
-        reshaped_entries: List[Dict[str, Any]] = []
-        for entry in e_map.get("entries", []) or []:
-            swimmers_in_entry = entry.get("swimmers", []) or []
-            swimmer_ids: List[Any] = []
-            for s in swimmers_in_entry:
-                # Each swimmer is a mapping with meet_id
-                sid = s.get("meet_id")
-                swimmer_ids.append(sid)
-
-            seed = _drop_none(
-                {
-                    "time": entry.get("seed_time"),
-                    "course": entry.get("seed_course"),
-                    "converted_time": entry.get("converted_seed_time"),
-                    "converted_course": entry.get("converted_seed_time_course"),
-                }
+    Existing paths are always literal, e.g. "meet [finals].hy3".
+    """
+    return not os.path.exists(path) and any(c in path for c in "*?[")
+
+
+def _find_inputs(paths: Iterable[str]) -> List[str]:
+    """Expand directories and glob patterns into absolute .hy3 file paths."""
+    inputs: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(os.listdir(path))
+            inputs.extend(
+                os.path.join(path, name)
+                for name in names
+                if name.lower().endswith(".hy3")
             )
+        elif _is_glob(path):
+            inputs.extend(sorted(glob.glob(path)))
+        else:
+            inputs.append(path)
+    return [os.path.abspath(path) for path in inputs]
+
+
+def _output_path(
+    input_path: str, args: argparse.Namespace, output_dir: Optional[str]
+) -> str:
+    """Get the output path for `input_path`, including any suffixes."""
+    if args.output and output_dir is None:
+        output_path = os.path.abspath(args.output)
+    else:
+        base, _ = os.path.splitext(input_path)
+        if output_dir is not None:
+            base = os.path.join(output_dir, os.path.basename(base))
+        output_path = base + _FORMAT_SUFFIXES[args.format]
 
-            def build_leg(prefix: str) -> Optional[Dict[str, Any]]:
-                dq_info = entry.get(f"{prefix}_dq_info")
-                dq: Optional[Dict[str, Any]]
-                if dq_info:
-                    dq = _drop_none(
-                        {
-                            "code": dq_info.get("code"),
-                            "info": dq_info.get("info_str"),
-                        }
-                    )
-                else:
-                    dq = None
-
-                leg = _drop_none(
-                    {
-                        "time": entry.get(f"{prefix}_time"),
-                        "course": entry.get(f"{prefix}_course"),
-                        "time_code": entry.get(f"{prefix}_time_code"),
-                        "dq": dq,
-                        "heat": entry.get(f"{prefix}_heat"),
-                        "lane": entry.get(f"{prefix}_lane"),
-                        "heat_place": entry.get(f"{prefix}_heat_place"),
-                        "overall_place": entry.get(f"{prefix}_overall_place"),
-                        "date": entry.get(f"{prefix}_date"),
-                        "splits": entry.get(f"{prefix}_splits"),
-                    }
-                )
-                return leg or None
-
-            reshaped_entries.append(
-                _drop_none(
-                    {
-                        "swimmers": swimmer_ids,
-                        "relay": bool(entry.get("relay", False)),
-                        "seed": seed or None,
-                        "prelim": build_leg("prelim"),
-                        "swimoff": build_leg("swimoff"),
-                        "finals": build_leg("finals"),
-                        "event_number": entry.get("event_number"),
-                    }
-                )
-            )
+    suffix = _COMPRESSION_SUFFIXES[args.compress]
+    if not output_path.endswith(suffix):
+        output_path += suffix
+    return output_path
 
-        e_out = _drop_none(
-            {
-                "number": e_map.get("number"),
-                "distance": e_map.get("distance"),
-                "stroke": e_map.get("stroke"),
-                "course": e_map.get("course"),
-                "date": e_map.get("date_"),
-                "fee": e_map.get("fee"),
-                "gender": e_map.get("gender"),
-                "gender_age": e_map.get("gender_age"),
-                "age_min": e_map.get("age_min"),
-                "age_max": e_map.get("age_max"),
-                "open": e_map.get("open_"),
-                "relay": bool(e_map.get("relay", False)),
-                "relay_team_id": e_map.get("relay_team_id"),
-                "relay_swim_team_code": e_map.get("relay_swim_team_code"),
-                "entries": reshaped_entries,
-            }
-        )
-        events_list.append(e_out)
 
-    meet_out = _drop_none(
-        {
-            "name": meet.get("name"),
-            "facility": meet.get("facility"),
-            "start_date": meet.get("start_date"),
-            "end_date": meet.get("end_date"),
-            "altitude": meet.get("altitude"),
-            "country": meet.get("country"),
-            "masters": meet.get("masters"),
-            "type": meet.get("type_"),
-            "course": meet.get("course"),
-            "teams": teams_list,
-            "swimmers": swimmers_list,
-            "events": events_list,
-        }
-    )
+def _resolve_paths(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> tuple[List[str], List[str]]:
+    """Get the input files and the output path for each of them.
 
-    return {"file": _drop_none(file_section), "meet": meet_out}
+    `-o` names a directory whenever the inputs may expand to several files
+    (more than one input, a directory or a glob) or it already is one.
+    """
+    inputs = _find_inputs(args.input)
+    if not inputs:
+        parser.error("no .hy3 files found")
+
+    output_dir: Optional[str] = None
+    if args.output and (
+        len(args.input) > 1
+        or os.path.isdir(args.output)
+        or any(os.path.isdir(path) or _is_glob(path) for path in args.input)
+    ):
+        output_dir = os.path.abspath(args.output)
+    outputs = [_output_path(path, args, output_dir) for path in inputs]
+
+    seen = set()
+    for output_path in outputs:
+        if output_path in seen:
+            parser.error(f"several inputs would be written to {output_path}")
+        seen.add(output_path)
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    return inputs, outputs
+
+
+def _convert(input_path: str, output_path: str, args: argparse.Namespace) -> str:
+    """Convert a single HY3 file, returning the path written to."""
+    parsed = parse_hy3(input_path, default_country=args.default_country)
+
+    with _open_output(output_path, args.compress) as f:
+        if args.raw:
+            raw = asdict(parsed, value_serializer=_value_serializer)
+            if args.format == "msgpack":
+                f.write(msgpack.packb(raw, use_bin_type=True, default=_default))
+            else:
+                f.write(_dumps(raw, args.indent))
+        elif args.format == "msgpack":
+            _emit_msgpack(parsed, f, args.fields, not args.summary)
+        else:
+            _emit(parsed, f, args.indent, args.fields, not args.summary)
+
+    return output_path
+
+
+def _validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject unavailable or conflicting options, exiting via `parser.error`."""
+    if args.format == "msgpack" and msgpack is None:
+        parser.error(
+            "--format msgpack requires the msgpack package "
+            "(pip install hytek-parser[msgpack])"
+        )
+    if args.compress == "zst" and zstandard is None:
+        parser.error(
+            "--compress zst requires the zstandard package "
+            "(pip install hytek-parser[zstd])"
+        )
+    if args.raw and args.fields is not None:
+        parser.error("--fields cannot be used with --raw")
+    if args.raw and args.summary:
+        parser.error("--summary cannot be used with --raw")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
 
 def main(argv: Optional[Iterable[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         prog="hy3-to-json", description="Convert Hytek HY3 files to JSON"
     )
-    parser.add_argument("input", help="Path to .hy3 file")
+    parser.add_argument(
+        "input",
+        nargs="+",
+        help="Path to .hy3 file(s), glob patterns, or directories of .hy3 files",
+    )
     parser.add_argument(
         "-o",
         "--output",
-        help="Path to output .json (defaults to <input>.json)",
+        help="Path to output file (defaults to <input>.json or <input>.msgpack); "
+        "an output directory when given several inputs, a directory or a glob",
         default=None,
     )
     parser.add_argument(
@@ -238,34 +815,66 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
     parser.add_argument(
         "--raw",
         action="store_true",
-        help="Do not post-process; emit raw structure from attrs.asdict",
+        help="Do not post-process; emit raw structure from attrs.asdict "
+        "(entry swimmers are given as meet ids)",
     )
     parser.add_argument(
         "--indent",
         type=int,
         default=2,
-        help="JSON indent level (default: 2)",
+        help="JSON indent level (default: 2, the only level orjson supports)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(_FORMAT_SUFFIXES),
+        default="json",
+        help="Output format (default: json); msgpack needs the msgpack extra",
+    )
+    parser.add_argument(
+        "--fields",
+        type=_parse_fields,
+        default=None,
+        help="Comma-separated dotted paths to keep, e.g. "
+        "swimmers.meet_id,events.number,events.entries.finals.time; "
+        'paths not starting with "file" or "meet" are relative to "meet"',
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Only output meet, team, swimmer and event info, without entries",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=sorted(_COMPRESSION_SUFFIXES),
+        default="none",
+        help="Compress the output, adding a .gz or .zst suffix (default: none); "
+        "zst needs the zstd extra",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of files to convert in parallel (default: 1)",
     )
 
     args = parser.parse_args(list(argv) if argv is not None else None)
-
-    input_path = os.path.abspath(args.input)
-    if args.output:
-        output_path = os.path.abspath(args.output)
+    _validate_args(parser, args)
+
+    inputs, outputs = _resolve_paths(parser, args)
+
+    if args.jobs > 1 and len(inputs) > 1:
+        # Files are independent, so convert them in separate processes
+        chunksize = max(1, len(inputs) // (4 * args.jobs))
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for output_path in executor.map(
+                _convert, inputs, outputs, repeat(args), chunksize=chunksize
+            ):
+                print(output_path)
     else:
-        base, _ = os.path.splitext(input_path)
-        output_path = base + ".json"
-
-    parsed = parse_hy3(input_path, default_country=args.default_country)
-    data = asdict(parsed, value_serializer=_value_serializer)
-
-    if not args.raw:
-        data = _post_process(data)
-
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=args.indent, ensure_ascii=False)
+        for input_path, output_path in zip(inputs, outputs):
+            print(_convert(input_path, output_path, args))
 
-    print(output_path)
     return 0
 
 
@@ -0,0 +1,228 @@
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from hytek_parser import cli, parse_hy3
+
+HY3_LINES = [
+    "A102Meet Entries             Hy-Tek, Ltd    Win-TM 8.0Ga  06272024 12:00 PMOakton Swim Team",
+    "B1NVSL A-Meet ML@OAK                           Oakton                                       062220240622202406012024            61",
+    "B2                                                                                           01 01Y",
+    "C1OAK  Oakton Swim Team              Oakton",
+    "D1M   27Hansen              Mads                                                        10272010 13                             27",
+    "E1M   27HanseXX    50D 11109  0U  0.00 22X   37.41S   37.41S    0.00    0.00  0NN               N                               70",
+    "E2F   36.12S          2  4  1   3                                                      06222024",
+    "G1F 1   36.12",
+]
+
+# A disqualified swimmer and a relay, each with only a finals result
+RESULTS_LINES = HY3_LINES[:5] + [
+    "D1F   28Olsen               Ida                                                         03142011 13",
+] + HY3_LINES[5:] + [
+    "E1F   28OlsenMB    50D 11 14      0.00 22X   38.50S   38.50S",
+    "E2F   37.80SQ1A       1  3  0   0                                                      06222024",
+    "H11AAlternating kick",
+    "F1OAK  A     MB   200E 11 14      0.00 101  120.00S  120.00S",
+    "F3    27      1    28      2",
+    "F2F  119.00S          1  4  1   1                                                                     06222024",
+]
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.input_path = self.write_hy3("meet.hy3", HY3_LINES)
+
+    def write_hy3(self, name: str, lines: list) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="latin-1") as f:
+            # Hytek pads every line to 128 chars followed by a checksum
+            f.write("\n".join(line.ljust(128) + "00" for line in lines))
+        return path
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def run_cli(self, *args: str) -> str:
+        output_path = os.path.join(self.tmp.name, "meet.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(0, cli.main([self.input_path, "-o", output_path, *args]))
+        return output_path
+
+    def load(self, *args: str) -> dict:
+        with open(self.run_cli(*args), encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_post_processed_output(self) -> None:
+        data = self.load()
+        self.assertEqual("Meet Entries", data["file"]["description"])
+        self.assertEqual("2024-06-27T12:00:00", data["file"]["date_created"])
+        self.assertEqual("SCY", data["meet"]["course"])
+        self.assertEqual([27], [s["meet_id"] for s in data["meet"]["swimmers"]])
+
+        event = data["meet"]["events"][0]
+        self.assertEqual("22X", event["number"])
+        self.assertEqual("BUTTERFLY", event["stroke"])
+
+        entry = event["entries"][0]
+        self.assertEqual([27], entry["swimmers"])
+        self.assertEqual({"time": 37.41, "course": "SCM", "converted_time": 37.41, "converted_course": "SCM"}, entry["seed"])
+        self.assertNotIn("prelim", entry)
+        self.assertEqual(36.12, entry["finals"]["time"])
+        self.assertEqual({"1": 36.12}, entry["finals"]["splits"])
+
+    def test_indent_matches_stdlib(self) -> None:
+        with open(self.run_cli("--indent", "2"), encoding="utf-8") as f:
+            two = f.read()
+        with open(self.run_cli("--indent", "4"), encoding="utf-8") as f:
+            four = f.read()
+        self.assertEqual(json.loads(two), json.loads(four))
+        self.assertEqual(json.dumps(json.loads(two), indent=2, ensure_ascii=False), two)
+        self.assertEqual(json.dumps(json.loads(four), indent=4, ensure_ascii=False), four)
+
+    def test_gzip_output(self) -> None:
+        with open(self.run_cli(), "rb") as f:
+            plain = f.read()
+        with gzip.open(self.run_cli("--compress", "gz") + ".gz") as f:
+            self.assertEqual(plain, f.read())
+
+    @unittest.skipIf(cli.msgpack is None, "msgpack is not installed")
+    def test_msgpack_output(self) -> None:
+        output_path = self.run_cli("--format", "msgpack")
+        with open(output_path, "rb") as f:
+            data = cli.msgpack.unpackb(f.read(), strict_map_key=False)
+        # Round trip through JSON to get the same string split keys
+        self.assertEqual(self.load(), json.loads(json.dumps(data)))
+
+    def test_batch_output(self) -> None:
+        self.write_hy3("other.hy3", HY3_LINES)
+        output_dir = os.path.join(self.tmp.name, "out")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(0, cli.main([self.tmp.name, "-o", output_dir, "--jobs", "2"]))
+        self.assertEqual(["meet.json", "other.json"], sorted(os.listdir(output_dir)))
+        with open(os.path.join(output_dir, "other.json"), encoding="utf-8") as f:
+            self.assertEqual(self.load(), json.load(f))
+
+    def test_directory_output_with_one_input(self) -> None:
+        input_dir = os.path.join(self.tmp.name, "meets")
+        os.mkdir(input_dir)
+        self.write_hy3(os.path.join("meets", "only.hy3"), HY3_LINES)
+        output_dir = os.path.join(self.tmp.name, "out")
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(0, cli.main([input_dir, "-o", output_dir]))
+            # An existing directory is used as such for a single file too
+            self.assertEqual(0, cli.main([self.input_path, "-o", output_dir]))
+        self.assertEqual(["meet.json", "only.json"], sorted(os.listdir(output_dir)))
+
+    def test_duplicate_outputs_rejected(self) -> None:
+        other_dir = os.path.join(self.tmp.name, "other")
+        os.mkdir(other_dir)
+        other = self.write_hy3(os.path.join("other", "meet.hy3"), HY3_LINES)
+        output_dir = os.path.join(self.tmp.name, "out")
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            cli.main([self.input_path, other, "-o", output_dir])
+        self.assertFalse(os.path.exists(output_dir))
+
+    def test_bracketed_input_is_not_a_glob(self) -> None:
+        self.input_path = self.write_hy3("meet [finals].hy3", HY3_LINES)
+        output_path = self.run_cli()
+        self.assertTrue(os.path.isfile(output_path))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(0, cli.main([self.input_path]))
+        self.assertTrue(os.path.isfile(os.path.join(self.tmp.name, "meet [finals].json")))
+
+    def test_emit_matches_post_process(self) -> None:
+        # The last file has no events at all
+        for path in (
+            self.input_path,
+            self.write_hy3("results.hy3", RESULTS_LINES),
+            self.write_hy3("empty.hy3", HY3_LINES[:5]),
+        ):
+            parsed = parse_hy3(path)
+            for indent in (0, 2, 4):
+                for selection in (None, cli._parse_fields("name,events.entries.seed")):
+                    f = io.BytesIO()
+                    cli._emit(parsed, f, indent, selection)
+                    expected = cli._dumps(cli._post_process(parsed, selection), indent)
+                    self.assertEqual(expected, f.getvalue())
+
+    def test_dq_and_relay_output(self) -> None:
+        self.input_path = self.write_hy3("results.hy3", RESULTS_LINES)
+        relay, individual = self.load()["meet"]["events"]
+
+        dq_entry = individual["entries"][1]
+        self.assertEqual([28], dq_entry["swimmers"])
+        self.assertEqual("DISQUALIFICATION", dq_entry["finals"]["time_code"])
+        self.assertEqual({"code": "FLY_KICK_ALTERNATING", "info": "Alternating kick"}, dq_entry["finals"]["dq"])
+        self.assertNotIn("dq", individual["entries"][0]["finals"])
+
+        self.assertEqual("101", relay["number"])
+        self.assertTrue(relay["relay"])
+        relay_entry = relay["entries"][0]
+        self.assertEqual([27, 28], relay_entry["swimmers"])
+        self.assertEqual(119.0, relay_entry["finals"]["time"])
+        # Legs that were never swum are left out rather than emitted as nulls
+        for entry in (dq_entry, relay_entry):
+            self.assertNotIn("prelim", entry)
+            self.assertNotIn("swimoff", entry)
+
+    def test_summary_output(self) -> None:
+        data = self.load("--summary")
+        self.assertEqual([], data["meet"]["events"][0]["entries"])
+        self.assertEqual("BUTTERFLY", data["meet"]["events"][0]["stroke"])
+
+    def test_parse_fields(self) -> None:
+        self.assertEqual(
+            {"file": None, "meet": {"events": {"number": None, "entries": None}}},
+            cli._parse_fields("file,events.number,events.entries,events.entries.seed"),
+        )
+
+    def test_parse_fields_rejects_unknown_fields(self) -> None:
+        for spec in ("", ",", "bogus", "events.entries.finals.bogus", "events.number.x"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                cli._parse_fields(spec)
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            self.run_cli("--fields", "evnts.number")
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "meet.json")))
+
+    def test_parse_fields_accepts_all_output_keys(self) -> None:
+        def paths(value: object, prefix: str) -> list:
+            if isinstance(value, list):
+                return [p for item in value for p in paths(item, prefix)]
+            if isinstance(value, dict) and not prefix.endswith(".splits"):
+                return [p for k, v in value.items() for p in paths(v, f"{prefix}.{k}")]
+            return [prefix]
+
+        data = cli._post_process(parse_hy3(self.write_hy3("results.hy3", RESULTS_LINES)))
+        all_paths = [p.lstrip(".") for p in paths(data, "")]
+        self.assertIn("meet.events.entries.finals.dq.info", all_paths)
+        cli._parse_fields(",".join(all_paths))
+
+    def test_fields_output(self) -> None:
+        data = self.load("--fields", "swimmers.meet_id,events.number,events.entries.finals.time")
+        self.assertEqual(
+            {"meet": {
+                "swimmers": [{"meet_id": 27}],
+                "events": [{"number": "22X", "entries": [{"finals": {"time": 36.12}}]}],
+            }},
+            data,
+        )
+        self.assertEqual({"file": {"licensee": "Oakton Swim Team"}}, self.load("--fields", "file.licensee"))
+
+    def test_sorted_events(self) -> None:
+        events = {"10": "c", "22X": "d", "2": "b", "1": "a"}
+        self.assertEqual(["1", "2", "10", "22X"], [k for k, _ in cli._sorted_events(events)])
+
+    def test_raw_output(self) -> None:
+        data = self.load("--raw")
+        self.assertEqual("Meet Entries", data["file_description"])
+        self.assertIn("22X", data["meet"]["events"])
+        self.assertEqual([27], data["meet"]["events"]["22X"]["entries"][0]["swimmers"])
+
+if __name__=='__main__':
+	unittest.main()